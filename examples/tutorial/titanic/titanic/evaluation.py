@@ -22,16 +22,42 @@ This is one of the main _formal_ forml components (along with `source` and `eval
 the forml loader.
 """
 
-from sklearn import model_selection, metrics
+import typing
+
+import numpy
+from sklearn import model_selection
 
 from forml.project import component
 from forml.lib.flow.operator.folding import evaluation
 
+
+def log_loss(ytrue: typing.Any, ypred: typing.Any, eps: float = 1e-15) -> float:
+    """Binary log loss metric.
+
+    This is a plain numpy equivalent of the sklearn.metrics.log_loss for our two-class case skipping its generic label
+    binarization and input validation.
+
+    Args:
+        ytrue: True binary labels.
+        ypred: Predicted probabilities of the positive class (or the full two-column predict_proba output).
+        eps: Clipping bound of the probabilities.
+
+    Returns: Log loss value.
+    """
+    proba = numpy.asarray(ypred, dtype=numpy.float64)
+    if proba.ndim == 2:
+        proba = proba[:, 1]
+    proba = numpy.clip(proba, eps, 1 - eps)
+    ytrue = numpy.asarray(ytrue)
+    return float(-numpy.mean(ytrue * numpy.log(proba) + (1 - ytrue) * numpy.log(1 - proba)))
+
+
 # Typical method of providing component implementation using `component.setup()`. Choosing the `MergingScorer` operator
-# to implement classical crossvalidated metric scoring
+# to implement classical crossvalidated metric scoring (the folds are independent task graph branches so the runner can
+# execute them concurrently)
 component.setup(
     evaluation.MergingScorer(
-        crossvalidator=model_selection.StratifiedKFold(n_splits=2, shuffle=True, random_state=42),
-        metric=metrics.log_loss,
+        crossvalidator=model_selection.StratifiedKFold(n_splits=5, shuffle=True, random_state=42),
+        metric=log_loss,
     )
 )
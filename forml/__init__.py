@@ -20,7 +20,3 @@ ForML top level.
 """
 __version__ = '0.2.dev0'
 __author__ = 'ForML Authors'
-
-from forml.conf import logging
-
-logging.setup()
@@ -27,6 +27,7 @@ import sys
 import typing
 
 from forml import conf, error
+from forml.conf import logging as logcfg
 
 LOGGER = logging.getLogger(__name__)
 
@@ -157,6 +158,7 @@ class Meta(type):
         return cls
 
     def __call__(cls):
+        logcfg.configure()
         namespace = cls.parser.parse_args()
         getattr(cls, getattr(namespace, cls.CMDKEY))(namespace)
 
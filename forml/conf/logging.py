@@ -29,10 +29,13 @@ from forml import conf
 
 LOGGER = logging.getLogger(__name__)
 DEFAULTS = dict(prj_name=conf.PRJNAME, log_facility=handlers.SysLogHandler.LOG_USER, log_path=f'./{conf.PRJNAME}.log')
+CONFIGURED = False
 
 
 def setup(*path: pathlib.Path, **defaults: typing.Any):
     """Setup logger according to the params."""
+    global CONFIGURED  # pylint: disable=global-statement
+    CONFIGURED = True
     parser = configparser.ConfigParser({**DEFAULTS, **defaults})
     tried = set()
     used = parser.read(
@@ -42,7 +45,7 @@ def setup(*path: pathlib.Path, **defaults: typing.Any):
             if not (p in tried or tried.add(p))
         )
     )
-    config.fileConfig(parser, disable_existing_loggers=True)
+    config.fileConfig(parser, disable_existing_loggers=False)  # not to disable loggers created before the setup
     logging.captureWarnings(capture=True)
     LOGGER.debug('Logging configs: %s', ', '.join(used) or 'none')
     LOGGER.debug('Application configs: %s', ', '.join(str(s) for s in conf.PARSER.sources) or 'none')
@@ -50,4 +53,20 @@ def setup(*path: pathlib.Path, **defaults: typing.Any):
         LOGGER.warning('Error parsing config %s: %s', src, err)
 
 
-conf.PARSER.subscribe(setup)  # reload logging config upon main config change to reflect potential new values
+def configure() -> None:
+    """Setup the logging using the default params unless already done.
+
+    This is deferred to the actual entrypoints (cli, setuptools, platform) instead of happening upon the forml import so
+    that processes merely importing forml (ie the runner workers) don't search/parse the configs and open the log files.
+    """
+    if not CONFIGURED:
+        setup()
+
+
+def reload() -> None:
+    """Reload the logging config upon main config change to reflect potential new values (if already configured)."""
+    if CONFIGURED:
+        setup()
+
+
+conf.PARSER.subscribe(reload)
@@ -66,6 +66,8 @@ def name(actor: typing.Any, *args, **kwargs) -> str:
 class Actor(metaclass=abc.ABCMeta):
     """Abstract interface of an actor."""
 
+    __slots__ = ()
+
     @classmethod
     def spec(cls, *args, **kwargs: typing.Any) -> 'Spec':
         """Shortcut for creating a spec of this actor.
@@ -86,6 +86,13 @@ class Container(typing.Generic[Symbol]):
         self._context: typing.Optional[Container.Context] = None
         self._stack: typing.List[Container.Context] = list()
 
+    def reset(self) -> None:
+        """Drop all of the pending contexts (possibly left behind by a failed parsing) so that the instance can be
+        reused from a clean state.
+        """
+        self._context = None
+        self._stack.clear()
+
     @property
     def context(self) -> 'Container.Context':
         """Context accessor."""
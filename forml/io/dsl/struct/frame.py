@@ -27,11 +27,13 @@ import operator
 import random
 import string
 import typing
+import weakref
 
 from forml.io.dsl import error, struct
 from forml.io.dsl.struct import series, visit
 
 LOGGER = logging.getLogger(__name__)
+SCHEMAHASH: typing.Dict[int, int] = {}  # process-local cache of the schema hashes keyed by the schema ids
 
 
 class Rows(typing.NamedTuple):
@@ -45,7 +47,13 @@ class Rows(typing.NamedTuple):
 
 
 class Source(tuple, metaclass=abc.ABCMeta):
-    """Source base class."""
+    """Source base class.
+
+    All the source types are immutable tuples declaring empty slots so that the (numerous) instances created when
+    building the queries carry no per-instance dictionaries.
+    """
+
+    __slots__ = ()
 
     def __new__(cls, *args):
         return super().__new__(cls, args)
@@ -86,15 +94,30 @@ class Source(tuple, metaclass=abc.ABCMeta):
         except KeyError as err:
             raise AttributeError(f'Invalid column {name}') from err
 
+    @property
     @functools.lru_cache()
+    def _lookup(self) -> typing.Mapping[str, 'series.Column']:
+        """Mapping of both the schema field keys and the column names to the actual columns built just once per source
+        leaving the attribute access to the columns a plain dictionary lookup.
+
+        Returns: Columns lookup table.
+        """
+        # reversed so that the first matching column takes precedence in case of a key-name collision
+        return {
+            n: c
+            for k, c in reversed(tuple(zip(self.schema, self.columns)))
+            for n in (self.schema[k].name, k)
+            if n is not None
+        }
+
     def __getitem__(self, name: typing.Union[int, str]) -> typing.Any:
         try:
             return super().__getitem__(name)
         except (TypeError, IndexError) as err:
-            for key, column in zip(self.schema, self.columns):
-                if name in {key, self.schema[key].name}:
-                    return column
-            raise KeyError(f'Invalid column {name}') from err
+            try:
+                return self._lookup[name]
+            except (TypeError, KeyError):
+                raise KeyError(f'Invalid column {name}') from err
 
     @abc.abstractmethod
     def accept(self, visitor: visit.Frame) -> None:
@@ -108,6 +131,8 @@ class Source(tuple, metaclass=abc.ABCMeta):
 class Join(Source):
     """Source made of two join-combined subsources."""
 
+    __slots__ = ()
+
     @enum.unique
     class Kind(enum.Enum):
         """Join type."""
@@ -157,6 +182,8 @@ class Join(Source):
 class Set(Source):
     """Source made of two set-combined subsources."""
 
+    __slots__ = ()
+
     @enum.unique
     class Kind(enum.Enum):
         """Set type."""
@@ -184,9 +211,11 @@ class Set(Source):
         visitor.visit_set(self)
 
 
-class Queryable(Source, metaclass=abc.ABCMeta):
+class Queryable(Source):
     """Base class for queryable sources."""
 
+    __slots__ = ()
+
     @property
     def query(self) -> 'Query':
         """Return query instance of this queryable.
@@ -266,12 +295,14 @@ class Queryable(Source, metaclass=abc.ABCMeta):
         return self.query.difference(other)
 
 
-class Origin(Queryable, metaclass=abc.ABCMeta):
+class Origin(Queryable):
     """Origin is a queryable that can be referenced by some identifier (rather than just a statement itself).
 
     It's columns are represented using series.Element.
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def columns(self) -> typing.Sequence['series.Element']:
@@ -284,6 +315,8 @@ class Origin(Queryable, metaclass=abc.ABCMeta):
 class Reference(Origin):
     """Reference is a wrapper around a queryable that associates it with a (possibly random) name."""
 
+    __slots__ = ()
+
     _NAMELEN: int = 8
     instance: Queryable = property(operator.itemgetter(0))
     name: str = property(operator.itemgetter(1))
@@ -323,6 +356,8 @@ class Table(Origin):
     This type can be used either as metaclass or as a base class to inherit from.
     """
 
+    __slots__ = ()
+
     class Schema(type):
         """Meta class for schema type ensuring consistent hashing."""
 
@@ -340,8 +375,24 @@ class Table(Origin):
             return super().__new__(mcs, name, bases, namespace)
 
         def __hash__(cls):
-            # pylint: disable=not-an-iterable
-            return functools.reduce(operator.xor, (hash(getattr(cls, k)) for k in cls), 0)
+            # the value is cached in a process-local registry rather than in the schema namespace as that would travel
+            # with the schema pickled by value into another process where the (identity based) field hashes differ
+            key = id(cls)
+            try:
+                return SCHEMAHASH[key]
+            except KeyError:
+                # pylint: disable=not-an-iterable
+                value = SCHEMAHASH[key] = functools.reduce(operator.xor, (hash(getattr(cls, k)) for k in cls), 0)
+                weakref.finalize(cls, SCHEMAHASH.pop, key, None)  # to not serve a stale value if the id gets reused
+                return value
+
+        def __setattr__(cls, key: str, value: typing.Any):
+            SCHEMAHASH.pop(id(cls), None)  # dropping the cached hash (ie populating the class skeleton when unpickling)
+            super().__setattr__(key, value)
+
+        def __delattr__(cls, key: str):
+            SCHEMAHASH.pop(id(cls), None)
+            super().__delattr__(key)
 
         def __eq__(cls, other: typing.Type['struct.Schema']):
             return len(cls) == len(other) and all(getattr(cls, c) == getattr(other, o) for c, o in zip(cls, other))
@@ -373,13 +424,16 @@ class Table(Origin):
         bases: typing.Optional[typing.Tuple[typing.Type]] = None,
         namespace: typing.Optional[typing.Dict[str, typing.Any]] = None,
     ):
+        if isinstance(schema, Table.Schema):  # used as constructor with an existing schema - the common runtime path
+            if bases or namespace:
+                raise TypeError('Unexpected use of schema table')
+            return tuple.__new__(mcs, (schema,))
         if isinstance(schema, str):  # used as metaclass
             if bases:
                 bases = (bases[0].schema,)
             schema = mcs.Schema(schema, bases, namespace)
-        else:
-            if bases or namespace:
-                raise TypeError('Unexpected use of schema table')
+        elif bases or namespace:
+            raise TypeError('Unexpected use of schema table')
         return super().__new__(mcs, schema)  # used as constructor
 
     def __repr__(self):
@@ -397,6 +451,8 @@ class Table(Origin):
 class Query(Queryable):
     """Generic source descriptor."""
 
+    __slots__ = ()
+
     source: Source = property(operator.itemgetter(0))
     selection: typing.Tuple['series.Column'] = property(operator.itemgetter(1))
     prefilter: typing.Optional['series.Expression'] = property(operator.itemgetter(2))
@@ -16,6 +16,9 @@
 # under the License.
 """
 Schema visitor APIs.
+
+The visiting is based on the classical double-dispatch - each of the DSL nodes invokes its specific visitor hook from
+within its accept method so there is no type inspection (or lookup) involved in the dispatching.
 """
 import abc
 import typing
@@ -29,6 +32,8 @@ if typing.TYPE_CHECKING:
 class Columnar(metaclass=abc.ABCMeta):
     """Base class for both Frame and Series visitors."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def visit_table(self, origin: 'frame.Table') -> None:
         """Table hook.
@@ -49,6 +54,8 @@ class Columnar(metaclass=abc.ABCMeta):
 class Frame(Columnar):
     """Frame visitor."""
 
+    __slots__ = ()
+
     def visit_source(self, source: 'frame.Source') -> None:  # pylint: disable=unused-argument, no-self-use
         """Generic source hook.
 
@@ -106,6 +113,8 @@ class Frame(Columnar):
 class Series(Columnar):
     """Series visitor."""
 
+    __slots__ = ()
+
     def visit_origin(self, origin: 'frame.Origin') -> None:  # pylint: disable=unused-argument, no-self-use
         """Tangible source hook.
 
@@ -19,7 +19,6 @@
 IO feed utils.
 """
 import abc
-import functools
 import logging
 import typing
 
@@ -75,7 +74,6 @@ class Provider(provmod.Interface, typing.Generic[parser.Source, parser.Column],
             Returns: Wrapper that applies formatting upon calling the provider.
             """
 
-            @functools.wraps(provider)
             def wrapper(*args, **kwargs) -> typing.Any:
                 """Wrapped provider with custom formatting.
 
@@ -87,6 +85,9 @@ class Provider(provmod.Interface, typing.Generic[parser.Source, parser.Column],
                 """
                 return self.format(provider(*args, **kwargs))
 
+            # not using functools.wraps as that would (for reader/slicer instances) copy the whole instance __dict__
+            # into the wrapper which then travels pickled with the actor spec alongside the original provider
+            wrapper.__wrapped__ = provider
             return wrapper
 
         def actor(handler: typing.Callable[..., typing.Any], spec: 'frame.Query') -> task.Spec:
@@ -98,22 +99,21 @@ class Provider(provmod.Interface, typing.Generic[parser.Source, parser.Column],
 
             Returns: Reader actor spec.
             """
-            return extract.Reader.Actor.spec(
-                handler, extract.Statement.prepare(spec, source.extract.ordinal, lower, upper)
-            )
+            return extract.Reader.Actor.spec(handler, extract.Statement.prepare(spec, ordinal, lower, upper))
 
-        reader = self.reader(self.sources, self.columns, **self._readerkw)
         query: 'frame.Query' = source.extract.train
+        ordinal: typing.Optional['series.Operable'] = source.extract.ordinal
+        labels: typing.Sequence['series.Column'] = source.extract.labels
+        reader = self.reader(self.sources, self.columns, **self._readerkw)  # shared by both the train and apply paths
         label: typing.Optional[task.Spec] = None
-        if source.extract.labels:  # trainset/label formatting is applied only after label extraction
-            query = query.select(*(*source.extract.train.columns, *source.extract.labels))
-            label = extract.Slicer.Actor.spec(
-                formatter(self.slicer(query.columns, self.columns)), source.extract.train.columns, source.extract.labels
-            )
+        if labels:  # trainset/label formatting is applied only after label extraction
+            features: typing.Sequence['series.Column'] = query.columns
+            query = query.select(*features, *labels)
+            label = extract.Slicer.Actor.spec(formatter(self.slicer(query.columns, self.columns)), features, labels)
+            train = actor(reader, query)
         else:  # testset formatting is applied straight away
-            reader = formatter(reader)
-        train = actor(reader, query)
-        apply = actor(formatter(self.reader(self.sources, self.columns, **self._readerkw)), source.extract.apply)
+            train = actor(formatter(reader), query)
+        apply = actor(formatter(reader), source.extract.apply)
         loader: topology.Composable = extract.Operator(apply, train, label)
         if source.transform:
             loader >>= source.transform
@@ -157,6 +157,10 @@ class Provider(provmod.Interface, typing.Generic[parser.Source, parser.Column],
     def format(cls, data: payload.ColumnMajor) -> typing.Any:
         """Optional post-formatting to be applied upon obtaining the columnar data from the raw reader.
 
+        The default is a pass-through as the core is agnostic of the payload format. Feeds are expected to override
+        this if their pipelines need a specific format - ideally converting directly from the reader-native format
+        without copying (ie Arrow based readers can use the ``to_pandas(split_blocks=True)`` for numeric data).
+
         Args:
             data: Input Columnar data to be formatted.
 
@@ -77,6 +77,8 @@ class Statement(typing.NamedTuple):
 
         Returns: prepared statement binding.
         """
+        if ordinal is None and (lower or upper):  # failing early at the assembly time rather than upon execution
+            raise error.Unexpected('Bounds provided but source not ordinal')
         return cls(cls.Prepared(query, ordinal), lower, upper)  # pylint: disable=no-member
 
     def __call__(self) -> frame.Query:
@@ -133,12 +135,13 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Column, payload.Native], met
         def __init__(self, reader: typing.Callable[[frame.Query], payload.ColumnMajor], statement: Statement):
             self._reader: typing.Callable[[frame.Query], payload.ColumnMajor] = reader
             self._statement: Statement = statement
+            self._query: frame.Query = statement()  # the statement is immutable so it can be expanded upfront
 
         def __repr__(self):
             return f'{repr(self._reader)}({repr(self._statement)})'
 
         def apply(self) -> typing.Any:
-            return self._reader(self._statement())
+            return self._reader(self._query)
 
     def __init__(
         self,
@@ -218,11 +221,11 @@ class Slicer:
             lcount = len(labels)
             self._features: slice = slice(fstop)
             self._label: typing.Union[slice, int] = slice(fstop, fstop + lcount) if lcount > 1 else fstop
+            # expected number of input columns (precomputed to keep the per-call validation trivial)
+            self._width: int = fstop + max(lcount, 1)
 
         def apply(self, columns: payload.ColumnMajor) -> typing.Tuple[typing.Any, typing.Any]:
-            assert len(columns) == (
-                self._label.stop if isinstance(self._label, slice) else self._label + 1
-            ), 'Unexpected number of columns for splitting'
+            assert len(columns) == self._width, 'Unexpected number of columns for splitting'
             return self._slicer(columns, self._features), self._slicer(columns, self._label)
 
     def __init__(self, schema: typing.Sequence[series.Column], columns: typing.Mapping[series.Column, parsmod.Column]):
@@ -230,5 +233,6 @@ class Slicer:
         self._columns: typing.Mapping[series.Column, parsmod.Column] = columns
 
     def __call__(self, source: payload.ColumnMajor, selection: typing.Union[slice, int]) -> payload.ColumnMajor:
-        LOGGER.debug('Selecting columns: %s', self._schema[selection])
+        if LOGGER.isEnabledFor(logging.DEBUG):  # avoiding the schema slicing unless really logging
+            LOGGER.debug('Selecting columns: %s', self._schema[selection])
         return source[selection]
@@ -29,26 +29,14 @@ Native = typing.TypeVar('Native')
 def transpose(data: typing.Sequence[Vector]) -> typing.Sequence[Vector]:
     """Primitive helper for transposing between row and column oriented generic matrices.
 
-    Note this performs badly compared to implementations available on specific data formats like numpy ndarray.
+    Note this performs badly compared to implementations available on specific data formats like numpy ndarray (even
+    though the actual transposition is delegated to the builtin zip rather than indexing each of the cells in python).
 
     Args:
         data: Input matrix.
 
     Returns: Transposed output matrix.
     """
-
-    def col(idx: int) -> Vector:
-        """Create a vector for given column index.
-
-        Args:
-            idx: Index of column to be generated.
-
-        Returns: Vector for given column.
-        """
-        return [data[r][idx] for r in range(nrows)]
-
     if data:
-        nrows = len(data)
-        ncols = len(data[0])
-        data = [col(c) for c in range(ncols)]
+        data = [list(c) for c in zip(*data)]
     return data
@@ -101,7 +101,13 @@ class TrainTestSplit(task.Actor):
             features: X table.
             label: Y series.
         """
-        self._indices = tuple(self.crossvalidator.split(features, label))  # tuple it so it can be pickled
+        # the indices are (as the actor state) shipped to all the splitter forks so storing them in the smallest
+        # sufficient int type rather than the default int64 to minimize the amount of data copied around
+        dtype = numpy.min_scalar_type(len(features))
+        self._indices = tuple(  # tuple it so it can be pickled
+            (numpy.asarray(a, dtype=dtype), numpy.asarray(b, dtype=dtype))
+            for a, b in self.crossvalidator.split(features, label)
+        )
 
     @auto
     def apply(self, source: pandas.DataFrame) -> typing.Sequence[pandas.DataFrame]:  # pylint: disable=arguments-differ
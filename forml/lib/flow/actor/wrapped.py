@@ -20,23 +20,38 @@ Utilities for creating actors using decorator wrappings.
 """
 
 import abc
+import functools
 import inspect
-import itertools
+import io
+import logging
+import pickle
 import typing
 
+import joblib
+
 from forml import error
 from forml.flow import task
 
+LOGGER = logging.getLogger(__name__)
+
 
 class Wrapping(metaclass=abc.ABCMeta):
-    """Base class for wrappers."""
+    """Base class for wrappers.
+
+    The slots are only declared by the final wrappers as the Class.Actor needs to keep its __dict__ for the upfront
+    binding of the mapped methods.
+    """
+
+    __slots__ = ()
 
     def __init__(self, actor: typing.Type, params: typing.Mapping[str, str]):
         self._actor: typing.Any = actor
-        self._params: typing.Mapping[str, str] = params
+        self._params: typing.Mapping[str, str] = dict(params)
+        # the hash value itself can't be cached as it is process specific while wrappers travel pickled
+        self._key: typing.Tuple[typing.Tuple[str, typing.Any], ...] = tuple(sorted(self._params.items()))
 
     def __hash__(self):
-        return hash(self._actor) ^ hash(tuple(sorted(self._params.items())))
+        return hash(self._actor) ^ hash(self._key)
 
     def __eq__(self, other: typing.Any):
         # pylint: disable=protected-access
@@ -67,17 +82,26 @@ class Wrapping(metaclass=abc.ABCMeta):
 class Mapping(Wrapping):
     """Base class for actor wrapping."""
 
+    __slots__ = ()
+
+    def __init__(self, actor: typing.Any, params: typing.Mapping[str, str]):
+        super().__init__(actor, params)
+        # probed just once as this gets queried repeatedly during the graph construction and the state handling
+        self._stateful: bool = hasattr(actor, self._params[task.Actor.train.__name__])
+
     def is_stateful(self) -> bool:
         """Emulation of native actor is_stateful class method.
 
         Returns: True if the wrapped actor is stateful (has a train method).
         """
-        return hasattr(self._actor, self._params[task.Actor.train.__name__])
+        return self._stateful
 
 
 class Class(Mapping):
     """Decorator wrapper."""
 
+    __slots__ = ('_actor', '_params', '_key', '_stateful')
+
     class Actor(Mapping, task.Actor):  # pylint: disable=abstract-method
         """Wrapper around user class implementing the Actor interface."""
 
@@ -87,14 +111,55 @@ class Class(Mapping):
 
         def __init__(self, actor: typing.Any, params: typing.Mapping[str, str]):
             super().__init__(actor, params)
+            self._bind()
+
+        def _bind(self) -> None:
+            """Bind the mapped methods of the wrapped instance upfront to make the access a plain lookup."""
+            for api, target in self._params.items():
+                if hasattr(self._actor, target):
+                    setattr(self, api, getattr(self._actor, target))
+
+        def get_state(self) -> bytes:
+            """Return the internal state of the actor.
+
+            Only the wrapped instance and the mapping are persisted (not the bound methods nor the other derived
+            attributes) to keep the state format independent of the wrapper internals.
+
+            Returns:
+                State as bytes.
+            """
+            if not self.is_stateful():
+                return bytes()
+            LOGGER.debug('Getting %s state', self)
+            with io.BytesIO() as bio:
+                joblib.dump({'_actor': self._actor, '_params': self._params}, bio, protocol=pickle.HIGHEST_PROTOCOL)
+                return bio.getvalue()
+
+        def set_state(self, state: bytes) -> None:
+            """Set new internal state of the actor rebinding the mapped methods to the restored instance. Note this
+            doesn't change the setting of the actor hyper-parameters.
+
+            Args:
+                state: bytes to be used as internal state.
+            """
+            if not state:
+                return
+            if not self.is_stateful():
+                raise error.Unexpected('State provided but actor stateless')
+            LOGGER.debug('Setting %s state (%d bytes)', self, len(state))
+            params = self.get_params()  # keep the original hyper-params
+            with io.BytesIO(state) as bio:
+                self._actor = joblib.load(bio)['_actor']  # any other attributes of past state formats are ignored
+            self._bind()
+            self.set_params(**params)  # restore the original hyper-params
 
         def __getnewargs__(self):
             return self._actor, self._params
 
-        def __getattribute__(self, item):
-            if item.startswith('_') or item not in self._params and not hasattr(self._actor, item):
-                return super().__getattribute__(item)
-            return getattr(self._actor, self._params.get(item, item))
+        def __getattr__(self, item):
+            if item.startswith('_'):
+                raise AttributeError(f'{self.__class__.__name__} has no attribute {item}')
+            return getattr(self._actor, item)
 
     def __init__(self, actor: typing.Type, params: typing.Mapping[str, str]):
         assert not issubclass(actor, task.Actor), 'Wrapping a true actor'
@@ -147,18 +212,19 @@ class Class(Mapping):
 class Function(Wrapping):
     """Function wrapping actor."""
 
+    __slots__ = ('_actor', '_params', '_key')
+
     class Actor(task.Actor):
         """Wrapper around user class implementing the Actor interface."""
 
+        __slots__ = ('_function', '_args', '_kwargs')
+
         def __init__(
             self, function: typing.Callable[[typing.Any], typing.Any], *args: typing.Any, **kwargs: typing.Any
         ):
             # poor-man's args validation against the function signature; this works only partially as we don't know
             # how many of the function arguments are data input ports (at least one but possibly more)
-            signature = inspect.signature(function)
-            signature.replace(parameters=itertools.islice(signature.parameters.values(), 1, None)).bind_partial(
-                *args, **kwargs
-            )
+            self._signature(function).bind_partial(*args, **kwargs)
             self._function: typing.Callable[[typing.Any], typing.Any] = function
             self._args: typing.Sequence[typing.Any] = args
             self._kwargs: typing.Mapping[str, typing.Any] = kwargs
@@ -166,6 +232,22 @@ class Function(Wrapping):
         def __repr__(self):
             return task.name(self._function, *self._args, **self._kwargs)
 
+        @staticmethod
+        @functools.lru_cache()
+        def _signature(function: typing.Callable[[typing.Any], typing.Any]) -> inspect.Signature:
+            """Get the function signature without its first parameter (the mandatory data input).
+
+            The reflection is expensive so it is cached to be done just once per each function rather than once per
+            each actor instance.
+
+            Args:
+                function: Function to get the signature for.
+
+            Returns: Signature of the params following the first one.
+            """
+            signature = inspect.signature(function)
+            return signature.replace(parameters=tuple(signature.parameters.values())[1:])
+
         def apply(self, *features: typing.Any) -> typing.Union[typing.Any, typing.Sequence[typing.Any]]:
             return self._function(*features, *self._args, **self._kwargs)
 
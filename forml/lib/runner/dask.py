@@ -94,9 +94,11 @@ class Runner(runtime.Runner, alias='dask'):
         feed: typing.Optional[feedmod.Provider] = None,
         sink: typing.Optional[sinkmod.Provider] = None,
         scheduler: typing.Optional[str] = None,
+        **schedkw: typing.Any,
     ):
         super().__init__(assets, feed, sink)
         self._scheduler: str = scheduler or self.SCHEDULER
+        self._schedkw: typing.Mapping[str, typing.Any] = schedkw
 
     def _run(self, symbols: typing.Sequence[code.Symbol]) -> None:
         """Actual run action to be implemented according to the specific runtime.
@@ -106,4 +108,4 @@ class Runner(runtime.Runner, alias='dask'):
         """
         dag = self.Dag(symbols)
         LOGGER.debug('Dask DAG: %s', dag)
-        importlib.import_module(f'{dask.__name__}.{self._scheduler}').get(dag, dag.output)
+        importlib.import_module(f'{dask.__name__}.{self._scheduler}').get(dag, dag.output, **self._schedkw)
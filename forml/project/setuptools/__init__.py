@@ -28,6 +28,7 @@ import setuptools
 from setuptools import *  # pylint: disable=redefined-builtin; # noqa: F401,F402,F403
 from setuptools import dist
 
+from forml.conf import logging as logcfg
 from forml.project.setuptools.command import launch, bdist, upload
 
 LOGGER = logging.getLogger(__name__)
@@ -68,5 +69,6 @@ def setup(**kwargs) -> typing.Optional[dist.Distribution]:  # pylint: disable=fu
     # To avoid infinite loops launching the setup.py when multiprocessing is involved in one of the commands (ie Dask
     # with multiprocessing scheduler is used as runner) we inspect the caller space to check the __name__ == '__main__'
     if inspect.currentframe().f_back.f_globals.get('__name__') == '__main__':
+        logcfg.configure()
         distribution = setuptools.setup(**{**kwargs, **OPTIONS})
     return distribution
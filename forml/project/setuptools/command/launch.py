@@ -18,7 +18,7 @@
 """
 Custom setuptools commands for pipeline execution modes.
 """
-import abc
+import functools
 import logging
 import os
 import typing
@@ -32,8 +32,14 @@ from forml.runtime import launcher as launchmod
 LOGGER = logging.getLogger(__name__)
 
 
-class Mode(test.test, metaclass=abc.ABCMeta):
-    """Development mode extra commands (based on the standard test mode)."""
+class Mode(test.test):
+    """Development mode extra commands (based on the standard test mode).
+
+    The particular modes need to be still distinct classes (as required by the setuptools command registration) but they
+    merely select the launcher mode to be dispatched to.
+    """
+
+    MODE: str = NotImplemented  # name of the launcher mode to run
 
     user_options = [
         ('runner=', 'R', 'runtime runner'),
@@ -54,9 +60,9 @@ class Mode(test.test, metaclass=abc.ABCMeta):
         """Fini options."""
         self.ensure_string_list('feed')
 
-    @property
+    @functools.cached_property
     def artifact(self) -> product.Artifact:
-        """Get the artifact for this project.
+        """Get the artifact for this project (built just once per the command instance).
 
         Returns: Artifact instance.
         """
@@ -80,9 +86,7 @@ class Mode(test.test, metaclass=abc.ABCMeta):
         if result is not None:
             print(result)
 
-    @staticmethod
-    @abc.abstractmethod
-    def launch(launcher: launchmod.Virtual.Builder, *args, **kwargs) -> typing.Any:
+    def launch(self, launcher: launchmod.Virtual.Builder, *args, **kwargs) -> typing.Any:
         """Executing the particular runner target.
 
         Args:
@@ -92,25 +96,23 @@ class Mode(test.test, metaclass=abc.ABCMeta):
 
         Returns: Whatever runner response.
         """
+        return getattr(launcher, self.MODE)(*args, **kwargs)
 
 
 class Train(Mode):
     """Development train mode."""
 
     description = 'trigger the development train mode'
-
-    @staticmethod
-    def launch(launcher: launchmod.Virtual.Builder, *args, **kwargs) -> typing.Any:
-        return launcher.train(*args, **kwargs)
+    MODE = 'train'
 
 
 class Tune(Mode):
     """Development tune mode."""
 
     description = 'trigger the development tune mode'
+    MODE = 'tune'
 
-    @staticmethod
-    def launch(launcher: launchmod.Virtual.Builder, *args, **kwargs) -> typing.Any:
+    def launch(self, launcher: launchmod.Virtual.Builder, *args, **kwargs) -> typing.Any:
         raise NotImplementedError('Tune mode is not yet supported')
 
 
@@ -118,7 +120,4 @@ class Eval(Mode):
     """Development eval mode."""
 
     description = 'trigger the model evaluation mode'
-
-    @staticmethod
-    def launch(launcher: launchmod.Virtual.Builder, *args, **kwargs) -> typing.Any:
-        return launcher.eval(*args, **kwargs)
+    MODE = 'eval'
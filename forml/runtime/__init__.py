@@ -22,6 +22,7 @@ import abc
 import typing
 
 from forml import provider as provmod, error
+from forml.conf import logging as logcfg
 from forml.conf.parsed import provider as provcfg
 from forml.flow import pipeline
 from forml.io import feed as feedmod, sink as sinkmod
@@ -274,6 +275,7 @@ class Platform:
         feeds: typing.Optional[typing.Iterable[typing.Union[provcfg.Feed, str, 'feedmod.Provider']]] = None,
         sink: typing.Optional[typing.Union[provcfg.Sink.Mode, str, sinkmod.Provider]] = None,
     ):
+        logcfg.configure()
         if isinstance(runner, str):
             runner = provcfg.Runner.resolve(runner)
         self._runner: provcfg.Runner = runner or provcfg.Runner.default
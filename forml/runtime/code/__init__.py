@@ -46,8 +46,10 @@ class Instruction(metaclass=abc.ABCMeta):
         return self.__class__.__name__
 
     def __call__(self, *args: typing.Any) -> typing.Any:
-        LOGGER.debug('%s invoked (%d args)', self, len(args))
-        start = time.time()
+        debug = LOGGER.isEnabledFor(logging.DEBUG)  # the timing is only relevant for the debug logging
+        if debug:
+            LOGGER.debug('%s invoked (%d args)', self, len(args))
+            start = time.perf_counter_ns()
         try:
             result = self.execute(*args)
         except Exception as err:
@@ -55,19 +57,24 @@ class Instruction(metaclass=abc.ABCMeta):
                 'Instruction %s failed when processing arguments: %s', self, ', '.join(f'{str(a):.1024s}' for a in args)
             )
             raise err
-        LOGGER.debug('%s completed (%.2fms)', self, (time.time() - start) * 1000)
+        if debug:
+            LOGGER.debug('%s completed (%.2fms)', self, (time.perf_counter_ns() - start) / 1e6)
         return result
 
 
 class Symbol(collections.namedtuple('Symbol', 'instruction, arguments')):
     """Main entity of the assembled code."""
 
+    __slots__ = ()
+
     def __new__(cls, instruction: Instruction, arguments: typing.Optional[typing.Sequence[Instruction]] = None):
         if arguments is None:
-            arguments = []
+            arguments = ()
+        elif not isinstance(arguments, tuple):  # the code generator already provides tuples so no need to copy
+            arguments = tuple(arguments)
         if not all(arguments):
             raise error.Missing('All arguments required')
-        return super().__new__(cls, instruction, tuple(arguments))
+        return super().__new__(cls, instruction, arguments)
 
     def __repr__(self):
         return f'{self.instruction}{self.arguments}'
@@ -203,13 +203,14 @@ class Table(view.Visitor, abc.Iterable):
 
             return (pick(a, b) for a, b in itertools.zip_longest(value, element))
 
-        stubs = {s for s in (self._index[n] for n in self._linkage.leaves) if isinstance(s, instmod.Getter)}
-        for instruction, keys in self._index.instructions:
+        index, linkage = self._index, self._linkage  # local bindings for the hot loop below
+        stubs = {s for s in (index[n] for n in linkage.leaves) if isinstance(s, instmod.Getter)}
+        for instruction, keys in index.instructions:
             if instruction in stubs:
                 LOGGER.debug('Pruning stub getter %s', instruction)
                 continue
-            arguments = functools.reduce(merge, (self._linkage[k] for k in keys))
-            yield code.Symbol(instruction, tuple(self._index[a] for a in arguments))
+            arguments = functools.reduce(merge, (linkage[k] for k in keys))
+            yield code.Symbol(instruction, tuple(index[a] for a in arguments))
 
     def add(self, node: grnode.Worker) -> None:
         """Populate the symbol table to implement the logical flow of given node.
@@ -0,0 +1,89 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML logging unit tests.
+"""
+# pylint: disable=no-self-use
+import os
+import pathlib
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from forml.conf import logging as logcfg
+
+
+def test_import():
+    """Test importing forml doesn't configure the logging."""
+    subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import logging, forml; from forml.conf import logging as logcfg; '
+            'assert not logcfg.CONFIGURED and not logging.getLogger().handlers',
+        ],
+        check=True,
+    )
+
+
+def test_existing(tmp_path: pathlib.Path):
+    """Test loggers created before configuring the logging stay enabled."""
+    subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import logging, forml; from forml.conf import logging as logcfg; '
+            'logger = logging.getLogger("myproject"); logcfg.configure(); assert not logger.disabled',
+        ],
+        cwd=tmp_path,  # the setup might create a log file in the working directory
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+        check=True,
+    )
+
+
+class TestSetup:
+    """Logging setup unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def setup(monkeypatch: pytest.MonkeyPatch) -> mock.MagicMock:
+        """Mocked setup (flagging the logging as configured) on top of not yet configured logging."""
+
+        def configured():
+            """Flag the logging as configured."""
+            monkeypatch.setattr(logcfg, 'CONFIGURED', True)
+
+        monkeypatch.setattr(logcfg, 'CONFIGURED', False)
+        monkeypatch.setattr(logcfg, 'setup', mock.MagicMock(side_effect=configured))
+        return logcfg.setup
+
+    def test_configure(self, setup: mock.MagicMock):
+        """Test the logging gets configured just once."""
+        logcfg.configure()
+        logcfg.configure()
+        setup.assert_called_once_with()
+
+    def test_reload(self, setup: mock.MagicMock):
+        """Test the reload is ignored unless configured."""
+        logcfg.reload()
+        setup.assert_not_called()
+        logcfg.configure()
+        logcfg.reload()
+        assert setup.call_count == 2
@@ -21,6 +21,7 @@ Global ForML unit tests fixtures.
 # pylint: disable=no-self-use
 import collections
 import datetime
+import os
 import pathlib
 import typing
 import uuid
@@ -34,6 +35,16 @@ from forml.lib.flow.actor import wrapped
 from forml.project import distribution, product
 from forml.runtime.asset.directory import project as prjmod, lineage as lngmod, generation as genmod
 
+TMPFS = pathlib.Path('/dev/shm')
+
+
+def pytest_configure(config) -> None:
+    """Optionally (if enabled using the FORML_TMPFS env var) redirecting the tmp_path base to the in-memory tmpfs to
+    avoid the disk latency of the filesystem heavy tests (ie the package creation/installation).
+    """
+    if not config.option.basetemp and os.getenv('FORML_TMPFS') == '1' and TMPFS.is_dir():
+        config.option.basetemp = str(TMPFS / 'forml-pytest')
+
 
 class WrappedActor:
     """Actor to-be mockup."""
@@ -56,6 +56,19 @@ class TestContainer:
             with storage:
                 storage.context.symbols.push(value)
 
+    def test_reset(self, storage, value):
+        """Test the reset recovering from a failed parsing."""
+        with pytest.raises(ValueError):
+            with storage:
+                storage.context.symbols.push(value)
+                raise ValueError('Failed parsing')
+        storage.reset()
+        with pytest.raises(RuntimeError):
+            storage.context  # pylint: disable=pointless-statement
+        with storage:
+            storage.context.symbols.push(value)
+            assert storage.fetch() == value
+
 
 class Frame(parsmod.Frame[tuple, tuple]):  # pylint: disable=unsubscriptable-object
     """Dummy frame parser wrapping all terms into tuples."""
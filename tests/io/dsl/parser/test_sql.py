@@ -40,15 +40,17 @@ class Parser(metaclass=abc.ABCMeta):
         query: frame.Query
         expected: str
 
-        def __call__(self, parser: sql.Frame):
-            def strip(value: str) -> str:
-                """Replace all whitespace with single space."""
-                return ' '.join(value.strip().split())
+        @staticmethod
+        def strip(value: str) -> str:
+            """Replace all whitespace with single space."""
+            return ' '.join(value.split())
 
+        def __call__(self, parser: sql.Frame):
+            parser.reset()
             with parser as visitor:
                 self.query.accept(visitor)
                 result = visitor.fetch()
-            assert strip(result) == strip(self.expected)
+            assert self.strip(result) == self.strip(self.expected)
 
     @staticmethod
     @pytest.fixture(scope='session')
@@ -63,9 +65,9 @@ class Parser(metaclass=abc.ABCMeta):
         return types.MappingProxyType({student.level: 'class'})
 
     @staticmethod
-    @pytest.fixture(scope='function')
+    @pytest.fixture(scope='session')
     def parser(sources: typing.Mapping[frame.Source, str], columns: typing.Mapping[series.Column, str]) -> sql.Frame:
-        """Parser fixture."""
+        """Parser fixture - shared across the tests as it gets reset by each case."""
         return sql.Frame(sources, columns)
 
     @classmethod
@@ -102,6 +104,7 @@ class TestLiteral(Parser):
             Parser.Case(datetime.date(2020, 7, 9), "DATE '2020-07-09'"),
             Parser.Case(datetime.datetime(2020, 7, 9, 7, 38, 21, 123456), "TIMESTAMP '2020-07-09 07:38:21'"),
         ),
+        ids=('integer', 'string', 'date', 'timestamp'),
     )
     def case(cls, request, student: frame.Table, school: frame.Table) -> Parser.Case:
         query = student.select(request.param.query)
@@ -126,6 +129,7 @@ class TestExpression(Parser):
                 2 * (function.Year(datetime.date(2020, 7, 9)) + series.Literal(1)), "2 * (year(DATE '2020-07-09') + 1)"
             ),
         ),
+        ids=('cast', 'arithmetic', 'year-timestamp', 'year-date', 'nested'),
     )
     def case(cls, request, student: frame.Table, school: frame.Table) -> Parser.Case:
         query = student.select(request.param.query)
@@ -153,6 +157,7 @@ class TestJoin(Parser):
             Parser.Case(Join(frame.Join.Kind.INNER, True), 'INNER'),
             Parser.Case(Join(frame.Join.Kind.CROSS, False), 'CROSS'),
         ),
+        ids=('default', 'left', 'right', 'full', 'inner', 'cross'),
     )
     def case(cls, request, student: frame.Table, school: frame.Table) -> Parser.Case:
         if request.param.query.condition:
@@ -180,6 +185,7 @@ class TestOrderBy(Parser):
             Parser.Case(series.Ordering.Direction.ASCENDING, 'ASC'),
             Parser.Case(series.Ordering.Direction.DESCENDING, 'DESC'),
         ),
+        ids=('default', 'ascending', 'descending'),
     )
     def case(cls, request, student: frame.Table, school: frame.Table) -> Parser.Case:
         query = student.select(student.score).orderby(series.Ordering(student.score, request.param.query))
@@ -21,6 +21,9 @@ ETL unit tests.
 # pylint: disable=no-self-use
 
 import abc
+import os
+import subprocess
+import sys
 import typing
 
 import cloudpickle
@@ -206,6 +209,32 @@ class TestSchema:
         assert schema is not other
         assert len({schema, other}) == 1
 
+    def test_hash(self):
+        """Test the (cached) schema hash isn't carried over when pickled by value into another process (even with the
+        same hash seed).
+        """
+        dump = (
+            'import sys, cloudpickle\n'
+            'from forml.io.dsl import struct\n'
+            'from forml.io.dsl.struct import kind\n'
+            'class Schema(struct.Schema):\n'
+            '    value = struct.Field(kind.Integer())\n'
+            'hash(Schema.schema)\n'
+            'sys.stdout.buffer.write(cloudpickle.dumps(Schema.schema))\n'  # __main__ schema gets pickled by value
+        )
+        load = (
+            'import sys, cloudpickle\n'
+            'from forml.io.dsl import struct\n'
+            'from forml.io.dsl.struct import kind\n'
+            'class Schema(struct.Schema):\n'
+            '    value = struct.Field(kind.Integer())\n'
+            'schema = cloudpickle.loads(sys.stdin.buffer.read())\n'
+            'assert schema == Schema.schema and hash(schema) == hash(Schema.schema)\n'
+        )
+        env = {**os.environ, 'PYTHONHASHSEED': '0', 'PYTHONPATH': os.pathsep.join(sys.path)}
+        pickled = subprocess.run([sys.executable, '-c', dump], env=env, stdout=subprocess.PIPE, check=True).stdout
+        subprocess.run([sys.executable, '-c', load], env=env, input=pickled, check=True)
+
     def test_colliding(self, schema: typing.Type['struct.Schema']):
         """Test schema with colliding field names."""
         with pytest.raises(error.Syntax):
@@ -0,0 +1,56 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Extract utils unit tests.
+"""
+# pylint: disable=no-self-use
+import datetime
+
+import pytest
+
+from forml import error
+from forml.io.dsl.struct import frame
+from forml.io.feed import extract
+
+
+class TestStatement:
+    """Statement unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def query(student: frame.Table) -> frame.Query:
+        """Base query fixture."""
+        return student.select(student.surname, student.score)
+
+    def test_ordinal(self, query: frame.Query, student: frame.Table):
+        """Test the bounds expansion of an ordinal statement."""
+        lower = datetime.date(2020, 1, 1)
+        upper = datetime.date(2021, 1, 1)
+        assert extract.Statement.prepare(query, student.dob)() == query
+        assert extract.Statement.prepare(query, student.dob, lower)() == query.where(student.dob >= lower)
+        assert extract.Statement.prepare(query, student.dob, upper=upper)() == query.where(student.dob < upper)
+        bounded = query.where(student.dob >= lower).where(student.dob < upper)
+        assert extract.Statement.prepare(query, student.dob, lower, upper)() == bounded
+
+    def test_unordinal(self, query: frame.Query):
+        """Test the statement of a source without any ordinal."""
+        assert extract.Statement.prepare(query, None)() == query
+        with pytest.raises(error.Unexpected):  # failing already upon the preparation
+            extract.Statement.prepare(query, None, lower=datetime.date(2020, 1, 1))
+        with pytest.raises(error.Unexpected):
+            extract.Statement.prepare(query, None, upper=datetime.date(2020, 1, 1))
@@ -19,7 +19,13 @@
 Wrapped actor unit tests.
 """
 # pylint: disable=no-self-use
+import io
+import pickle
+import typing
+
+import joblib
 import pytest
+
 from forml.flow import task
 from forml.lib.flow.actor import wrapped
 
@@ -48,3 +54,67 @@ class TestFunction:
     def test_apply(self, actor: task.Actor):
         """Actor applying test."""
         assert actor(old='baz', new='foo').apply('baz bar') == 'foo bar'
+
+
+class TestClass:
+    """Wrapped class unit tests."""
+
+    class Actor:
+        """Actor to-be mockup."""
+
+        def __init__(self, **params):
+            self.model = None
+            self.params = params
+
+        def fit(self, features, labels) -> None:
+            """Train to-be handler."""
+            self.model = features, labels
+
+        def predict(self, features) -> typing.Tuple[typing.Any, typing.Any, typing.Any]:
+            """Apply to-be handler."""
+            if self.model is None:
+                raise ValueError('Not Fitted')
+            return features, self.model, self.params
+
+        def get_params(self) -> typing.Mapping[str, typing.Any]:
+            """Get hyper-parameters of this actor."""
+            return dict(self.params)
+
+        def set_params(self, **params: typing.Any):
+            """Set hyper-parameters of this actor."""
+            self.params.update(params)
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def actor() -> typing.Type[task.Actor]:
+        """Actor fixture."""
+        return wrapped.Class.actor(TestClass.Actor, train='fit', apply='predict')
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def trained(actor: typing.Type[task.Actor]) -> task.Actor:
+        """Trained actor instance fixture."""
+        instance = actor(a=1)
+        instance.train('foo', 'bar')
+        return instance
+
+    def test_state(self, actor: typing.Type[task.Actor], trained: task.Actor):
+        """Test the state roundtrip."""
+        state = trained.get_state()
+        assert set(joblib.load(io.BytesIO(state))) == {'_actor', '_params'}
+        restored = actor(a=2)
+        restored.set_state(state)
+        assert restored.apply('baz') == ('baz', ('foo', 'bar'), {'a': 2})
+        restored.train('bar', 'foo')  # the bound methods must be operating on the restored instance
+        assert restored.apply('baz') == ('baz', ('bar', 'foo'), {'a': 2})
+        assert restored.get_state() != state
+
+    def test_legacy_state(self, actor: typing.Type[task.Actor], trained: task.Actor):
+        """Test loading a state persisted in the original format (plain dump of the actor __dict__)."""
+        with io.BytesIO() as bio:
+            # pylint: disable=protected-access
+            joblib.dump({'_actor': trained._actor, '_params': trained._params}, bio, protocol=pickle.HIGHEST_PROTOCOL)
+            state = bio.getvalue()
+        restored = actor(a=2)
+        restored.set_state(state)
+        assert restored.apply('baz') == ('baz', ('foo', 'bar'), {'a': 2})
@@ -0,0 +1,61 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Dask runner unit tests.
+"""
+# pylint: disable=no-self-use,protected-access
+import typing
+from unittest import mock
+
+import pytest
+from dask import threaded
+
+from forml.lib.runner import dask
+from forml.runtime import code
+
+
+class Instruction(code.Instruction):
+    """Instruction mockup."""
+
+    def execute(self, *args: typing.Any) -> typing.Any:
+        return 'foo'
+
+
+class TestRunner:
+    """Dask runner unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def get(monkeypatch: pytest.MonkeyPatch) -> mock.MagicMock:
+        """Threaded scheduler get function mock (wrapping the original)."""
+        get = mock.MagicMock(wraps=threaded.get)
+        monkeypatch.setattr(threaded, 'get', get)
+        return get
+
+    @staticmethod
+    @pytest.fixture(scope='session', params=({}, {'num_workers': 2}), ids=('default', 'custom'))
+    def schedkw(request) -> typing.Mapping[str, typing.Any]:
+        """Extra runner params fixture."""
+        return request.param
+
+    def test_schedkw(self, get: mock.MagicMock, schedkw: typing.Mapping[str, typing.Any]):
+        """Test the extra runner params get passed to the scheduler."""
+        runner = dask.Runner(mock.MagicMock(), mock.MagicMock(), scheduler='threaded', **schedkw)
+        runner._run([code.Symbol(Instruction())])
+        get.assert_called_once()
+        assert get.call_args.kwargs == schedkw
@@ -19,13 +19,13 @@
 Project distribution tests.
 """
 # pylint: disable=no-self-use
-import os
 import pathlib
+import typing
 
 import pytest
 
 from forml import error
-from forml.project import distribution
+from forml.project import distribution, product
 
 
 @pytest.fixture(scope='session')
@@ -34,23 +34,48 @@ def project_manifest() -> distribution.Manifest:
     return distribution.Manifest('foo', '1.0.dev1', 'bar', baz='baz')
 
 
+@pytest.fixture(scope='session')
+def manifest_path(project_manifest: distribution.Manifest, tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Path of the project manifest written (just once) to a temp location."""
+    path = tmp_path_factory.mktemp('manifest')
+    project_manifest.write(path)
+    return path
+
+
+@pytest.fixture(scope='session')
+def installed_artifact(
+    project_package: distribution.Package, tmp_path_factory: pytest.TempPathFactory
+) -> product.Artifact:
+    """Artifact of the project package installed (just once) to a temp location."""
+    return project_package.install(tmp_path_factory.mktemp('install') / 'foo')
+
+
 class TestManifest:
     """Manifest unit tests."""
 
-    def test_rw(self, tmp_path: pathlib.Path, project_manifest):
+    def test_rw(self, manifest_path: pathlib.Path, project_manifest: distribution.Manifest):
         """Test reading/writing a manifest."""
-        project_manifest.write(tmp_path)
-        assert distribution.Manifest.read(tmp_path) == project_manifest
+        assert distribution.Manifest.read(manifest_path) == project_manifest
+
+    @staticmethod
+    @pytest.fixture(scope='function', params=('invalid', 'missing'))
+    def unreadable(request, tmp_path: pathlib.Path) -> typing.Tuple[pathlib.Path, typing.Type[error.Error]]:
+        """Unreadable manifest fixture - either an invalid (empty) manifest module or none at all - returned together
+        with the exception expected when reading it.
+        """
+        if request.param == 'invalid':
+            (tmp_path / f'{distribution.Manifest.MODULE}.py').touch()
+            return tmp_path, error.Invalid
+        return tmp_path, error.Missing
+
+    def test_unreadable(self, unreadable: typing.Tuple[pathlib.Path, typing.Type[error.Error]]):
+        """Test reading invalid manifests."""
+        path, exception = unreadable
+        with pytest.raises(exception):
+            distribution.Manifest.read(path)
 
-    def test_invalid(self, tmp_path: str):
+    def test_invalid(self):
         """Test invalid manifests."""
-        path = os.path.join(tmp_path, f'{distribution.Manifest.MODULE}.py')
-        os.open(path, os.O_CREAT)
-        with pytest.raises(error.Invalid):  # Invalid manifest
-            distribution.Manifest.read(tmp_path)
-        os.remove(path)
-        with pytest.raises(error.Missing):  # Unknown manifest
-            distribution.Manifest.read(tmp_path)
         with pytest.raises(error.Invalid):
             distribution.Manifest('foo', 'invalid.version', 'project')
 
@@ -63,8 +88,7 @@ class TestPackage:
         result = distribution.Package.create(project_package.path, project_package.manifest, tmp_path / 'testpkg.4ml')
         assert result.manifest == project_package.manifest
 
-    def test_install(self, project_package: distribution.Package, tmp_path: pathlib.Path):
+    def test_install(self, project_package: distribution.Package, installed_artifact: product.Artifact):
         """Package install unit test."""
-        artifact = project_package.install(tmp_path / 'foo')
-        assert artifact.package == project_package.manifest.package
-        assert artifact.descriptor
+        assert installed_artifact.package == project_package.manifest.package
+        assert installed_artifact.descriptor